@@ -6,8 +6,10 @@ Provides Islamic prayer times, Qibla direction, and Hijri date conversion
 
 import sys
 import json
+import time
 import asyncio
-import requests
+import aiohttp
+import orjson
 import datetime
 from typing import Any, Dict, List, Optional
 from mcp.server import Server
@@ -22,250 +24,341 @@ from mcp.types import (
 import mcp.server.stdio
 
 # Aladhan API configuration
-ALADHAN_API_BASE_URL = "http://api.aladhan.com/v1"
+ALADHAN_API_BASE_URL = "https://api.aladhan.com"
+
+# Display labels for the prayer timings returned by the API
+PRAYER_NAMES = {
+    "Fajr": "🌅 Fajr (Dawn)",
+    "Sunrise": "☀️ Sunrise",
+    "Dhuhr": "🌞 Dhuhr (Noon)",
+    "Asr": "🌤️ Asr (Afternoon)",
+    "Sunset": "🌇 Sunset",
+    "Maghrib": "🌆 Maghrib (Evening)",
+    "Isha": "🌙 Isha (Night)"
+}
+
+# Compass points in 45° buckets, starting from North
+COMPASS = ("North", "Northeast", "East", "Southeast",
+           "South", "Southwest", "West", "Northwest")
 
 # Create server instance
 server = Server("aladhan-api")
 
-def call_aladhan_api(endpoint: str, params: dict = None) -> dict:
+# Shared HTTP session, created in main() so it lives on the running event loop
+_session: Optional[aiohttp.ClientSession] = None
+
+# In-process cache for idempotent endpoints: key -> (stored_at, response dict).
+# TTLs are keyed by the first path segment of the endpoint; Qibla direction
+# never changes for a coordinate pair, so it is effectively cached forever.
+_CACHE: Dict[tuple, tuple] = {}
+_CACHE_MAX_ENTRIES = 4096
+_ENDPOINT_TTLS = {
+    "methods": 86400,
+    "qibla": 10**9,
+    "gToH": 86400,
+    "timingsByCity": 3600,
+    "timings": 3600,
+}
+
+async def cached_call(endpoint: str, params: dict = None) -> dict:
+    """Call the Aladhan API, serving repeats from the in-process TTL cache."""
+    ttl = _ENDPOINT_TTLS.get(endpoint.split("/", 1)[0], 0)
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    cached = _CACHE.get(key)
+    if cached is not None:
+        stored_at, result = cached
+        if time.monotonic() - stored_at < ttl:
+            return result
+    result = await call_aladhan_api(endpoint, params=params)
+    if ttl and "error" not in result:
+        if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[key] = (time.monotonic(), result)
+    return result
+
+# Cached validators for conditional requests: key -> (etag, last_modified, body).
+# When the TTL cache expires, the next fetch revalidates and a 304 reuses the
+# stored body instead of re-downloading it.
+_ETAGS: Dict[tuple, tuple] = {}
+
+async def call_aladhan_api(endpoint: str, params: dict = None) -> dict:
     """Generic helper to call the Aladhan API."""
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    validators = _ETAGS.get(key)
+    headers = {}
+    if validators is not None:
+        etag, last_modified, _ = validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
     try:
-        url = f"{ALADHAN_API_BASE_URL}/{endpoint}"
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        async with _session.get(f"/v1/{endpoint}", params=params, headers=headers) as response:
+            if response.status == 304 and validators is not None:
+                return validators[2]
+            response.raise_for_status()
+            # orjson decodes the raw bytes faster than stdlib json
+            result = orjson.loads(await response.read())
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                if len(_ETAGS) >= _CACHE_MAX_ENTRIES:
+                    _ETAGS.pop(next(iter(_ETAGS)))
+                _ETAGS[key] = (etag, last_modified, result)
+            return result
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         return {"error": str(e), "details": "Failed to connect to Aladhan API"}
     except ValueError:
         return {"error": "Invalid JSON response from Aladhan API"}
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools for the Aladhan API."""
-    return [
-        Tool(
-            name="get_prayer_times_by_city",
-            description="Get Islamic prayer times for a specific city and date",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "Name of the city (e.g., London)"
-                    },
-                    "country": {
-                        "type": "string", 
-                        "description": "Name of the country (e.g., UK)"
-                    },
-                    "date": {
-                        "type": "string",
-                        "description": "Date in YYYY-MM-DD format (optional, defaults to today)",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    },
-                    "method": {
-                        "type": "integer",
-                        "description": "Calculation method ID (optional, 1-15)"
-                    },
-                    "school": {
-                        "type": "integer",
-                        "enum": [0, 1],
-                        "description": "Asr juristic method: 0 for Shafi, 1 for Hanafi (optional)"
-                    }
+# Tool definitions are static, so build them once at import time instead of
+# reallocating the schema dicts on every list_tools round-trip
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_prayer_times_by_city",
+        description="Get Islamic prayer times for a specific city and date",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "city": {
+                    "type": "string",
+                    "description": "Name of the city (e.g., London)"
                 },
-                "required": ["city", "country"]
-            }
-        ),
-        Tool(
-            name="get_prayer_times_by_coordinates",
-            description="Get Islamic prayer times for specific geographic coordinates and date",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "latitude": {
-                        "type": "number",
-                        "description": "Latitude of the location"
-                    },
-                    "longitude": {
-                        "type": "number", 
-                        "description": "Longitude of the location"
-                    },
-                    "date": {
-                        "type": "string",
-                        "description": "Date in YYYY-MM-DD format (optional, defaults to today)",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    },
-                    "method": {
-                        "type": "integer",
-                        "description": "Calculation method ID (optional, 1-15)"
-                    },
-                    "school": {
-                        "type": "integer",
-                        "enum": [0, 1],
-                        "description": "Asr juristic method: 0 for Shafi, 1 for Hanafi (optional)"
-                    }
+                "country": {
+                    "type": "string", 
+                    "description": "Name of the country (e.g., UK)"
                 },
-                "required": ["latitude", "longitude"]
-            }
-        ),
-        Tool(
-            name="convert_gregorian_to_hijri",
-            description="Convert a Gregorian date to Hijri (Islamic) date",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "date": {
-                        "type": "string",
-                        "description": "Gregorian date in DD-MM-YYYY format (e.g., 20-07-2024)",
-                        "pattern": "^\\d{2}-\\d{2}-\\d{4}$"
-                    }
+                "date": {
+                    "type": "string",
+                    "description": "Date in YYYY-MM-DD format (optional, defaults to today)",
+                    "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
                 },
-                "required": ["date"]
-            }
-        ),
-        Tool(
-            name="get_qibla_direction",
-            description="Get the Qibla direction (degrees from North) for given coordinates",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "latitude": {
-                        "type": "number",
-                        "description": "Latitude of the location"
-                    },
-                    "longitude": {
-                        "type": "number",
-                        "description": "Longitude of the location"
-                    }
+                "method": {
+                    "type": "integer",
+                    "description": "Calculation method ID (optional, 1-15)"
+                },
+                "school": {
+                    "type": "integer",
+                    "enum": [0, 1],
+                    "description": "Asr juristic method: 0 for Shafi, 1 for Hanafi (optional)"
+                }
+            },
+            "required": ["city", "country"]
+        }
+    ),
+    Tool(
+        name="get_prayer_times_by_coordinates",
+        description="Get Islamic prayer times for specific geographic coordinates and date",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "latitude": {
+                    "type": "number",
+                    "description": "Latitude of the location"
+                },
+                "longitude": {
+                    "type": "number", 
+                    "description": "Longitude of the location"
+                },
+                "date": {
+                    "type": "string",
+                    "description": "Date in YYYY-MM-DD format (optional, defaults to today)",
+                    "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
+                },
+                "method": {
+                    "type": "integer",
+                    "description": "Calculation method ID (optional, 1-15)"
                 },
-                "required": ["latitude", "longitude"]
-            }
-        ),
-        Tool(
-            name="get_calculation_methods",
-            description="Get available prayer time calculation methods",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
-        )
-    ]
+                "school": {
+                    "type": "integer",
+                    "enum": [0, 1],
+                    "description": "Asr juristic method: 0 for Shafi, 1 for Hanafi (optional)"
+                }
+            },
+            "required": ["latitude", "longitude"]
+        }
+    ),
+    Tool(
+        name="convert_gregorian_to_hijri",
+        description="Convert a Gregorian date to Hijri (Islamic) date",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "description": "Gregorian date in DD-MM-YYYY format (e.g., 20-07-2024)",
+                    "pattern": "^\\d{2}-\\d{2}-\\d{4}$"
+                }
+            },
+            "required": ["date"]
+        }
+    ),
+    Tool(
+        name="get_qibla_direction",
+        description="Get the Qibla direction (degrees from North) for given coordinates",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "latitude": {
+                    "type": "number",
+                    "description": "Latitude of the location"
+                },
+                "longitude": {
+                    "type": "number",
+                    "description": "Longitude of the location"
+                }
+            },
+            "required": ["latitude", "longitude"]
+        }
+    ),
+    Tool(
+        name="get_calculation_methods",
+        description="Get available prayer time calculation methods",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    ),
+    Tool(
+        name="get_prayer_times_batch",
+        description="Get Islamic prayer times for several cities in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "description": "List of city/country queries fetched concurrently",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "city": {
+                                "type": "string",
+                                "description": "Name of the city (e.g., London)"
+                            },
+                            "country": {
+                                "type": "string",
+                                "description": "Name of the country (e.g., UK)"
+                            },
+                            "date": {
+                                "type": "string",
+                                "description": "Date in YYYY-MM-DD format (optional, defaults to today)",
+                                "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
+                            }
+                        },
+                        "required": ["city", "country"]
+                    }
+                }
+            },
+            "required": ["queries"]
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools for the Aladhan API."""
+    return _TOOLS
+
+async def _fetch_timings(endpoint_prefix: str, loc_params: dict,
+                         date_str: Optional[str] = None,
+                         method: Optional[int] = None,
+                         school: Optional[int] = None) -> dict:
+    """Fetch prayer timings for a location, defaulting to today's date."""
+    # Handle date (the schema already guarantees YYYY-MM-DD)
+    if date_str:
+        date_obj = datetime.date.fromisoformat(date_str)
+    else:
+        date_obj = datetime.date.today()
+
+    api_date_str = f"{date_obj.day:02d}-{date_obj.month:02d}-{date_obj.year}"
+
+    # Build parameters
+    params = dict(loc_params)
+    if method is not None:
+        params["method"] = method
+    if school is not None:
+        params["school"] = school
+
+    return await cached_call(f"{endpoint_prefix}/{api_date_str}", params=params)
+
+# Cap concurrent upstream requests per batch to stay clear of rate limits
+_BATCH_CONCURRENCY = 8
+
+async def _fetch_timings_bounded(semaphore: asyncio.Semaphore, endpoint_prefix: str,
+                                 loc_params: dict, date_str: Optional[str] = None) -> dict:
+    """Fetch timings while holding a slot on the batch semaphore."""
+    async with semaphore:
+        return await _fetch_timings(endpoint_prefix, loc_params, date_str)
+
+def _format_timings(result: dict, header: str) -> list[TextContent]:
+    """Format a timings response into the tool's text output."""
+    if "error" in result:
+        return [TextContent(type="text", text=f"Error: {result['error']}")]
+
+    if "data" in result and "timings" in result["data"]:
+        data = result["data"]
+        timings = data["timings"]
+        date_info = data["date"]
+
+        parts = [header]
+        parts.append(f"📅 Date: {date_info['readable']} ({date_info['hijri']['date']} {date_info['hijri']['month']['en']} {date_info['hijri']['year']} AH)\n\n")
+        parts.extend(f"{PRAYER_NAMES[prayer]}: {prayer_time}\n"
+                     for prayer, prayer_time in timings.items()
+                     if prayer in PRAYER_NAMES)
+
+        return [TextContent(type="text", text="".join(parts))]
+    else:
+        return [TextContent(type="text", text="No prayer time data found in response")]
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls for the Aladhan API."""
-    
+
     try:
         if name == "get_prayer_times_by_city":
             city = arguments["city"]
             country = arguments["country"]
-            date_str = arguments.get("date")
-            method = arguments.get("method")
-            school = arguments.get("school")
-            
-            # Handle date
-            if date_str:
-                date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-            else:
-                date_obj = datetime.date.today()
-            
-            api_date_str = date_obj.strftime("%d-%m-%Y")
-            
-            # Build parameters
-            params = {"city": city, "country": country}
-            if method is not None:
-                params["method"] = method
-            if school is not None:
-                params["school"] = school
-            
-            result = call_aladhan_api(f"timingsByCity/{api_date_str}", params=params)
-            
-            if "error" in result:
-                return [TextContent(type="text", text=f"Error: {result['error']}")]
-            
-            if "data" in result and "timings" in result["data"]:
-                data = result["data"]
-                timings = data["timings"]
-                date_info = data["date"]
-                
-                response = f"🕌 Prayer Times for {city}, {country}\n"
-                response += f"📅 Date: {date_info['readable']} ({date_info['hijri']['date']} {date_info['hijri']['month']['en']} {date_info['hijri']['year']} AH)\n\n"
-                
-                prayer_names = {
-                    "Fajr": "🌅 Fajr (Dawn)",
-                    "Sunrise": "☀️ Sunrise", 
-                    "Dhuhr": "🌞 Dhuhr (Noon)",
-                    "Asr": "🌤️ Asr (Afternoon)",
-                    "Sunset": "🌇 Sunset",
-                    "Maghrib": "🌆 Maghrib (Evening)",
-                    "Isha": "🌙 Isha (Night)"
-                }
-                
-                for prayer, time in timings.items():
-                    if prayer in prayer_names:
-                        response += f"{prayer_names[prayer]}: {time}\n"
-                
-                return [TextContent(type="text", text=response)]
-            else:
-                return [TextContent(type="text", text="No prayer time data found in response")]
-        
+            result = await _fetch_timings(
+                "timingsByCity",
+                {"city": city, "country": country},
+                arguments.get("date"), arguments.get("method"), arguments.get("school")
+            )
+            return _format_timings(result, f"🕌 Prayer Times for {city}, {country}\n")
+
         elif name == "get_prayer_times_by_coordinates":
             latitude = arguments["latitude"]
             longitude = arguments["longitude"]
-            date_str = arguments.get("date")
-            method = arguments.get("method")
-            school = arguments.get("school")
-            
-            # Handle date
-            if date_str:
-                date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-            else:
-                date_obj = datetime.date.today()
-            
-            api_date_str = date_obj.strftime("%d-%m-%Y")
-            
-            # Build parameters
-            params = {"latitude": latitude, "longitude": longitude}
-            if method is not None:
-                params["method"] = method
-            if school is not None:
-                params["school"] = school
-            
-            result = call_aladhan_api(f"timings/{api_date_str}", params=params)
-            
-            if "error" in result:
-                return [TextContent(type="text", text=f"Error: {result['error']}")]
-            
-            if "data" in result and "timings" in result["data"]:
-                data = result["data"]
-                timings = data["timings"]
-                date_info = data["date"]
-                
-                response = f"🕌 Prayer Times for coordinates ({latitude}, {longitude})\n"
-                response += f"📅 Date: {date_info['readable']} ({date_info['hijri']['date']} {date_info['hijri']['month']['en']} {date_info['hijri']['year']} AH)\n\n"
-                
-                prayer_names = {
-                    "Fajr": "🌅 Fajr (Dawn)",
-                    "Sunrise": "☀️ Sunrise",
-                    "Dhuhr": "🌞 Dhuhr (Noon)", 
-                    "Asr": "🌤️ Asr (Afternoon)",
-                    "Sunset": "🌇 Sunset",
-                    "Maghrib": "🌆 Maghrib (Evening)",
-                    "Isha": "🌙 Isha (Night)"
-                }
-                
-                for prayer, time in timings.items():
-                    if prayer in prayer_names:
-                        response += f"{prayer_names[prayer]}: {time}\n"
-                
-                return [TextContent(type="text", text=response)]
-            else:
-                return [TextContent(type="text", text="No prayer time data found in response")]
-        
+            result = await _fetch_timings(
+                "timings",
+                {"latitude": latitude, "longitude": longitude},
+                arguments.get("date"), arguments.get("method"), arguments.get("school")
+            )
+            return _format_timings(result, f"🕌 Prayer Times for coordinates ({latitude}, {longitude})\n")
+
+        elif name == "get_prayer_times_batch":
+            queries = arguments["queries"]
+            semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+            results = await asyncio.gather(
+                *[_fetch_timings_bounded(semaphore, "timingsByCity",
+                                         {"city": q["city"], "country": q["country"]},
+                                         q.get("date"))
+                  for q in queries],
+                return_exceptions=True
+            )
+
+            contents = []
+            for q, result in zip(queries, results):
+                if isinstance(result, BaseException):
+                    contents.append(TextContent(type="text", text=f"Error: {result}"))
+                else:
+                    contents.extend(_format_timings(result, f"🕌 Prayer Times for {q['city']}, {q['country']}\n"))
+            return contents
+
         elif name == "convert_gregorian_to_hijri":
             date_str = arguments["date"]
             
-            result = call_aladhan_api("gToH", params={"date": date_str})
+            result = await cached_call("gToH", params={"date": date_str})
             
             if "error" in result:
                 return [TextContent(type="text", text=f"Error: {result['error']}")]
@@ -274,13 +367,13 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                 hijri = result["data"]["hijri"]
                 gregorian = result["data"]["gregorian"]
                 
-                response = f"📅 Date Conversion\n\n"
-                response += f"Gregorian: {gregorian['date']} {gregorian['month']['en']} {gregorian['year']}\n"
-                response += f"Hijri: {hijri['date']} {hijri['month']['en']} {hijri['year']} AH\n"
-                response += f"Islamic Month: {hijri['month']['ar']} ({hijri['month']['en']})\n"
-                response += f"Weekday: {hijri['weekday']['en']}\n"
-                
-                return [TextContent(type="text", text=response)]
+                parts = ["📅 Date Conversion\n\n"]
+                parts.append(f"Gregorian: {gregorian['date']} {gregorian['month']['en']} {gregorian['year']}\n")
+                parts.append(f"Hijri: {hijri['date']} {hijri['month']['en']} {hijri['year']} AH\n")
+                parts.append(f"Islamic Month: {hijri['month']['ar']} ({hijri['month']['en']})\n")
+                parts.append(f"Weekday: {hijri['weekday']['en']}\n")
+
+                return [TextContent(type="text", text="".join(parts))]
             else:
                 return [TextContent(type="text", text="No date conversion data found")]
         
@@ -288,7 +381,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             latitude = arguments["latitude"]
             longitude = arguments["longitude"]
             
-            result = call_aladhan_api(f"qibla/{latitude}/{longitude}")
+            result = await cached_call(f"qibla/{latitude}/{longitude}")
             
             if "error" in result:
                 return [TextContent(type="text", text=f"Error: {result['error']}")]
@@ -296,57 +389,46 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             if "data" in result and "direction" in result["data"]:
                 direction = result["data"]["direction"]
                 
-                response = f"🧭 Qibla Direction\n\n"
-                response += f"📍 Location: ({latitude}, {longitude})\n"
-                response += f"🕋 Qibla Direction: {direction:.2f}° from North\n\n"
-                
-                # Add compass direction description
-                if 337.5 <= direction or direction < 22.5:
-                    compass = "North"
-                elif 22.5 <= direction < 67.5:
-                    compass = "Northeast"
-                elif 67.5 <= direction < 112.5:
-                    compass = "East"
-                elif 112.5 <= direction < 157.5:
-                    compass = "Southeast"
-                elif 157.5 <= direction < 202.5:
-                    compass = "South"
-                elif 202.5 <= direction < 247.5:
-                    compass = "Southwest"
-                elif 247.5 <= direction < 292.5:
-                    compass = "West"
-                else:
-                    compass = "Northwest"
-                
-                response += f"Compass Direction: {compass}"
-                
-                return [TextContent(type="text", text=response)]
+                parts = ["🧭 Qibla Direction\n\n"]
+                parts.append(f"📍 Location: ({latitude}, {longitude})\n")
+                parts.append(f"🕋 Qibla Direction: {direction:.2f}° from North\n\n")
+
+                # Add compass direction description (45° buckets around North)
+                compass = COMPASS[int((direction + 22.5) // 45) % 8]
+
+                parts.append(f"Compass Direction: {compass}")
+
+                return [TextContent(type="text", text="".join(parts))]
             else:
                 return [TextContent(type="text", text="No Qibla direction data found")]
         
         elif name == "get_calculation_methods":
-            result = call_aladhan_api("methods")
+            result = await cached_call("methods")
             
             if "error" in result:
                 return [TextContent(type="text", text=f"Error: {result['error']}")]
             
             if "data" in result:
-                methods = result["data"]
-                
-                response = "🕌 Prayer Time Calculation Methods\n\n"
-                
-                for method_id, method_info in methods.items():
-                    if isinstance(method_info, dict) and "name" in method_info:
-                        response += f"{method_id}. {method_info['name']}\n"
-                        if "params" in method_info:
-                            params = method_info["params"]
-                            if "Fajr" in params:
-                                response += f"   - Fajr: {params['Fajr']}°\n"
-                            if "Isha" in params:
-                                response += f"   - Isha: {params['Isha']}°\n"
-                        response += "\n"
-                
-                return [TextContent(type="text", text=response)]
+                # Pluck just the fields we render so the full upstream dict
+                # can be dropped before the formatting loop
+                slim = [(method_id, method_info["name"],
+                         method_info.get("params", {}).get("Fajr"),
+                         method_info.get("params", {}).get("Isha"))
+                        for method_id, method_info in result["data"].items()
+                        if isinstance(method_info, dict) and "name" in method_info]
+                del result
+
+                parts = ["🕌 Prayer Time Calculation Methods\n\n"]
+
+                for method_id, method_name, fajr, isha in slim:
+                    parts.append(f"{method_id}. {method_name}\n")
+                    if fajr is not None:
+                        parts.append(f"   - Fajr: {fajr}°\n")
+                    if isha is not None:
+                        parts.append(f"   - Isha: {isha}°\n")
+                    parts.append("\n")
+
+                return [TextContent(type="text", text="".join(parts))]
             else:
                 return [TextContent(type="text", text="No calculation methods data found")]
         
@@ -357,13 +439,24 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
 
 async def main():
-    # Run the server using stdin/stdout streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    global _session
+    # Share one pooled session across all tool calls for the server's lifetime.
+    # AsyncResolver uses aiodns (from aiohttp[speedups]) so DNS lookups don't
+    # block a thread-pool executor, and resolved addresses are cached for 5 min.
+    async with aiohttp.ClientSession(
+        base_url=ALADHAN_API_BASE_URL,
+        connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300,
+                                       use_dns_cache=True,
+                                       resolver=aiohttp.AsyncResolver()),
+        timeout=aiohttp.ClientTimeout(total=10, connect=3.05)
+    ) as _session:
+        # Run the server using stdin/stdout streams
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
 
 if __name__ == "__main__":
     asyncio.run(main())